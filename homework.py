@@ -1,13 +1,19 @@
 import os
 import sys
+import math
 import time
 import logging
 import requests
 
 
 from telegram import Bot
+from telegram.error import RetryAfter, TelegramError
+from collections import OrderedDict
 from http import HTTPStatus
+from operator import itemgetter
+from urllib3.util.retry import Retry
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
 from typing import List, Dict, Union
 from datetime import datetime, timedelta
 from exceptions.exceptions import WrongConnectionError, BotSendMessageError
@@ -19,18 +25,62 @@ TELEGRAM_TOKEN = os.getenv('TELEGRAM_TOKEN')
 TELEGRAM_CHAT_ID = os.getenv('TELEGRAM_CHAT_ID')
 
 RETRY_TIME = 10
+try:
+    MAX_RETRY_TIME = int(os.getenv('MAX_RETRY_TIME', 60))
+except ValueError:
+    MAX_RETRY_TIME = None
 COUNT_PREVIOUS_DAYS = 30
 ERROR_MESSAGE_LENGTH = 100
+MAX_TRACKED_HOMEWORKS = 1000
+SEND_MESSAGE_INTERVAL = 1.0
 ENDPOINT = 'https://practicum.yandex.ru/api/user_api/homework_statuses/'
 HEADERS = {'Authorization': f'OAuth {PRACTICUM_TOKEN}'}
+REQUEST_TIMEOUT = (5, 30)
 
 VERDICTS = {
     'approved': 'Работа проверена: ревьюеру всё понравилось. Ура!',
     'reviewing': 'Работа взята на проверку ревьюером.',
     'rejected': 'Работа проверена: у ревьюера есть замечания.'
 }
+_TEMPLATES = {
+    status: 'Изменился статус проверки работы "{name}". ' + verdict
+    for status, verdict in VERDICTS.items()
+}
 
 logger = logging.getLogger(__name__)
+_last_send_times: Dict[str, float] = {}
+
+SESSION = requests.Session()
+SESSION.mount('https://', HTTPAdapter(
+    pool_connections=1,
+    pool_maxsize=2,
+    max_retries=Retry(
+        total=3,
+        read=False,
+        backoff_factor=0.5,
+        status_forcelist=[500, 502, 503, 504],
+        raise_on_status=False
+    )
+))
+
+
+def _throttled_send(bot: Bot, message: str) -> None:
+    """Отправка сообщения с учетом ограничений telegram на частоту."""
+
+    elapsed = time.monotonic() - _last_send_times.get(TELEGRAM_CHAT_ID, 0.0)
+    if elapsed < SEND_MESSAGE_INTERVAL:
+        time.sleep(SEND_MESSAGE_INTERVAL - elapsed)
+    try:
+        bot.send_message(TELEGRAM_CHAT_ID, message)
+    except RetryAfter as error:
+        logger.warning(
+            'Превышен лимит отправки сообщений, повтор через %s с',
+            error.retry_after
+        )
+        time.sleep(error.retry_after)
+        bot.send_message(TELEGRAM_CHAT_ID, message)
+    finally:
+        _last_send_times[TELEGRAM_CHAT_ID] = time.monotonic()
 
 
 def send_message(bot: Bot, message: str) -> str:
@@ -38,24 +88,28 @@ def send_message(bot: Bot, message: str) -> str:
 
     logger.info('Начало отправки сообщения ботом')
     try:
-        bot.send_message(TELEGRAM_CHAT_ID, message)
-    except BotSendMessageError as error:
+        _throttled_send(bot, message)
+    except TelegramError as error:
         message = (f'Боту не удалось отправить сообщение: {message} по '
                    f'причине {error}')
         logger.error(message)
-        raise BotSendMessageError(message)
+        raise BotSendMessageError(message) from error
     else:
-        logger.info(f'Бот отправил сообщение: {message}')
+        logger.info('Бот отправил сообщение: %s', message)
 
 
 def get_api_answer(current_timestamp: int) -> Dict[str, Union[list, int]]:
     """Выполнение запроса к сервису и проверка полученного результата."""
 
-    timestamp = current_timestamp or int(time.time())
-    params = {'from_date': timestamp}
+    params = {'from_date': current_timestamp}
     try:
         logger.info('Начато выполнение запроса к API')
-        response = requests.get(ENDPOINT, headers=HEADERS, params=params)
+        response = SESSION.get(
+            ENDPOINT, headers=HEADERS, params=params, timeout=REQUEST_TIMEOUT
+        )
+    except requests.exceptions.Timeout as error:
+        message = f'Превышено время ожидания ответа сервиса {error}'
+        raise ConnectionError(message) from error
     except Exception as error:
         message = f'Недоступен endpoint сервиса {error}'
         raise ConnectionError(message) from error
@@ -79,7 +133,7 @@ def check_response(response: dict) -> List[list]:
 
     if not isinstance(response, dict):
         raise TypeError('Ответ сервиса не является словарем')
-    if not all(['current_date' in response, 'homeworks' in response]):
+    if 'homeworks' not in response or 'current_date' not in response:
         raise KeyError('В ответе сервиса нет данных по нужным ключам')
     if not isinstance(response['homeworks'], list):
         raise TypeError('Данные homeworks не являются списком')
@@ -92,12 +146,68 @@ def parse_status(homework: list) -> str:
     homework_name = homework['homework_name']
     homework_status = homework['status']
     try:
-        verdict = VERDICTS[homework_status]
-        return f'Изменился статус проверки работы "{homework_name}". {verdict}'
+        template = _TEMPLATES[homework_status]
     except KeyError as error:
         raise KeyError(
             f'Получен недокументированный статус домашней работы - {error}'
         )
+    return template.format(name=homework_name)
+
+
+def remember_status(last_statuses: OrderedDict, homework: dict) -> bool:
+    """Запоминание статуса работы, True если он отличается от прошлого."""
+
+    homework_id = homework['id']
+    if last_statuses.get(homework_id) == homework['status']:
+        return False
+    last_statuses[homework_id] = homework['status']
+    last_statuses.move_to_end(homework_id)
+    if len(last_statuses) > MAX_TRACKED_HOMEWORKS:
+        last_statuses.popitem(last=False)
+    return True
+
+
+def is_valid_timestamp(value) -> bool:
+    """Проверка, что значение является неотрицательной меткой времени."""
+
+    return (
+        isinstance(value, (int, float))
+        and not isinstance(value, bool)
+        and math.isfinite(value)
+        and value >= 0
+    )
+
+
+def next_interval(interval: int, has_updates: bool) -> int:
+    """Расчет паузы до следующего запроса к API."""
+
+    if has_updates:
+        return RETRY_TIME
+    return min(interval * 2, max(RETRY_TIME, MAX_RETRY_TIME))
+
+
+def send_new_status(
+    bot: Bot, homeworks: List[dict], last_statuses: OrderedDict
+) -> None:
+    """Отправка статуса самой свежей работы, если он изменился."""
+
+    if not homeworks:
+        logger.debug('В ответе нет новых статусов.')
+        return
+    homework = max(homeworks, key=itemgetter('id'))
+    message = parse_status(homework)
+    if remember_status(last_statuses, homework):
+        send_message(bot, message)
+
+
+def report_error(bot: Bot, message: str) -> None:
+    """Отправка сообщения о сбое без повторного сбоя при отправке."""
+
+    try:
+        send_message(bot, message)
+    except BotSendMessageError:
+        # Сбой отправки уже залогирован в send_message.
+        pass
 
 
 def check_tokens() -> bool:
@@ -114,32 +224,46 @@ def main():
         message = 'Не заполнены переменные окружения.'
         logger.critical(message)
         raise sys.exit(message)
+    if MAX_RETRY_TIME is None:
+        message = 'Некорректное значение переменной окружения MAX_RETRY_TIME.'
+        logger.critical(message)
+        raise sys.exit(message)
 
     bot = Bot(token=TELEGRAM_TOKEN)
     previous_time = datetime.now() - timedelta(days=COUNT_PREVIOUS_DAYS)
     current_timestamp = int(previous_time.timestamp())
-    previous_messages = {'message': '', 'error': ''}
+    previous_error = ''
+    last_statuses = OrderedDict()
+    interval = RETRY_TIME
+    next_tick = time.monotonic()
 
     while True:
         try:
             response = get_api_answer(current_timestamp)
             homeworks = check_response(response)
-            if len(homeworks) > 0:
-                homework = sorted(homeworks, key=lambda x: x['id'])[-1]
-                message = parse_status(homework)
-                if previous_messages['message'] != message:
-                    previous_messages['message'] = message
-                    send_message(bot, message)
+            interval = next_interval(interval, len(homeworks) > 0)
+            send_new_status(bot, homeworks, last_statuses)
+            response_timestamp = response.get('current_date')
+            if is_valid_timestamp(response_timestamp):
+                current_timestamp = int(response_timestamp)
             else:
-                logger.debug('В ответе нет новых статусов.')
-            current_timestamp = response['current_date']
+                logger.warning(
+                    'Некорректное значение current_date в ответе: %r',
+                    response_timestamp
+                )
+        except BotSendMessageError:
+            # Ошибка уже залогирована в send_message, сообщение о ней
+            # в telegram только усилит перегрузку.
+            pass
         except Exception as error:
             message = f'Сбой в работе программы: {error}'
             logger.error(message)
-            if previous_messages['error'] != message[:ERROR_MESSAGE_LENGTH]:
-                previous_messages['error'] = message[:ERROR_MESSAGE_LENGTH]
-                send_message(bot, message)
-        time.sleep(RETRY_TIME)
+            error_key = message[:ERROR_MESSAGE_LENGTH]
+            if previous_error != error_key:
+                previous_error = error_key
+                report_error(bot, message)
+        next_tick = max(next_tick + interval, time.monotonic())
+        time.sleep(max(0.0, next_tick - time.monotonic()))
 
 
 if __name__ == '__main__':
@@ -19,3 +19,16 @@ def current_timestamp():
 @pytest.fixture
 def api_url():
     return 'https://practicum.yandex.ru/api/user_api/homework_statuses/'
+
+
+@pytest.fixture
+def adapter_session():
+    """Session with the bot's HTTPS adapter mounted for local http urls."""
+    import requests
+
+    import homework
+
+    session = requests.Session()
+    session.mount('http://', homework.SESSION.get_adapter(homework.ENDPOINT))
+    yield session
+    session.close()
@@ -1,5 +1,9 @@
 import os
+import socket
+import threading
+from collections import OrderedDict
 from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, HTTPServer
 
 import requests
 import telegram
@@ -186,10 +190,10 @@ class TestHomework:
                 current_timestamp=current_timestamp, **kwargs
             )
 
-        monkeypatch.setattr(requests, 'get', mock_response_get)
-
         import homework
 
+        monkeypatch.setattr(homework.SESSION, 'get', mock_response_get)
+
         func_name = 'get_api_answer'
         utils.check_function(homework, func_name, 1)
 
@@ -232,10 +236,10 @@ class TestHomework:
             response.json = json_invalid
             return response
 
-        monkeypatch.setattr(requests, 'get', mock_500_response_get)
-
         import homework
 
+        monkeypatch.setattr(homework.SESSION, 'get', mock_500_response_get)
+
         func_name = 'get_api_answer'
         try:
             homework.get_api_answer(current_timestamp)
@@ -315,10 +319,10 @@ class TestHomework:
             response.json = valid_response_json
             return response
 
-        monkeypatch.setattr(requests, 'get', mock_response_get)
-
         import homework
 
+        monkeypatch.setattr(homework.SESSION, 'get', mock_response_get)
+
         func_name = 'check_response'
         response = homework.get_api_answer(current_timestamp)
         status = homework.check_response(response)
@@ -352,10 +356,10 @@ class TestHomework:
             response.json = valid_response_json
             return response
 
-        monkeypatch.setattr(requests, 'get', mock_response_get)
-
         import homework
 
+        monkeypatch.setattr(homework.SESSION, 'get', mock_response_get)
+
         func_name = 'parse_status'
         response = homework.get_api_answer(current_timestamp)
         homeworks = homework.check_response(response)
@@ -400,10 +404,10 @@ class TestHomework:
             response.json = valid_response_json
             return response
 
-        monkeypatch.setattr(requests, 'get', mock_response_get)
-
         import homework
 
+        monkeypatch.setattr(homework.SESSION, 'get', mock_response_get)
+
         func_name = 'parse_status'
         response = homework.get_api_answer(current_timestamp)
         homeworks = homework.check_response(response)
@@ -448,10 +452,10 @@ class TestHomework:
             response.json = valid_response_json
             return response
 
-        monkeypatch.setattr(requests, 'get', mock_response_get)
-
         import homework
 
+        monkeypatch.setattr(homework.SESSION, 'get', mock_response_get)
+
         func_name = 'parse_status'
         response = homework.get_api_answer(current_timestamp)
         homeworks = homework.check_response(response)
@@ -484,10 +488,10 @@ class TestHomework:
             response.json = json_invalid
             return response
 
-        monkeypatch.setattr(requests, 'get', mock_no_homeworks_response_get)
-
         import homework
 
+        monkeypatch.setattr(homework.SESSION, 'get', mock_no_homeworks_response_get)
+
         func_name = 'check_response'
         result = homework.get_api_answer(current_timestamp)
         try:
@@ -525,10 +529,10 @@ class TestHomework:
             response.json = valid_response_json
             return response
 
-        monkeypatch.setattr(requests, 'get', mock_response_get)
-
         import homework
 
+        monkeypatch.setattr(homework.SESSION, 'get', mock_response_get)
+
         func_name = 'check_response'
         response = homework.get_api_answer(current_timestamp)
         try:
@@ -565,10 +569,10 @@ class TestHomework:
             response.json = valid_response_json
             return response
 
-        monkeypatch.setattr(requests, 'get', mock_response_get)
-
         import homework
 
+        monkeypatch.setattr(homework.SESSION, 'get', mock_response_get)
+
         func_name = 'check_response'
         response = homework.get_api_answer(current_timestamp)
         try:
@@ -599,10 +603,10 @@ class TestHomework:
             response.json = json_invalid
             return response
 
-        monkeypatch.setattr(requests, 'get', mock_empty_response_get)
-
         import homework
 
+        monkeypatch.setattr(homework.SESSION, 'get', mock_empty_response_get)
+
         func_name = 'check_response'
         result = homework.get_api_answer(current_timestamp)
         try:
@@ -626,10 +630,10 @@ class TestHomework:
             )
             return response
 
-        monkeypatch.setattr(requests, 'get', mock_response_get)
-
         import homework
 
+        monkeypatch.setattr(homework.SESSION, 'get', mock_response_get)
+
         func_name = 'check_response'
         try:
             homework.get_api_answer(current_timestamp)
@@ -640,3 +644,315 @@ class TestHomework:
                 f'Убедитесь, что в функции `{func_name}` обрабатываете ситуацию, '
                 'когда API возвращает код, отличный от 200'
             )
+
+    def test_api_response_read_timeout(self, monkeypatch, adapter_session):
+        import homework
+
+        listener = socket.socket()
+        listener.bind(('127.0.0.1', 0))
+        listener.listen(5)
+        connections = []
+
+        def accept_silently():
+            while True:
+                try:
+                    connections.append(listener.accept()[0])
+                except OSError:
+                    return
+
+        threading.Thread(target=accept_silently, daemon=True).start()
+        monkeypatch.setattr(homework, 'SESSION', adapter_session)
+        monkeypatch.setattr(
+            homework, 'ENDPOINT',
+            f'http://127.0.0.1:{listener.getsockname()[1]}/'
+        )
+        monkeypatch.setattr(homework, 'REQUEST_TIMEOUT', (1, 0.2))
+
+        func_name = 'get_api_answer'
+        try:
+            homework.get_api_answer(1)
+        except ConnectionError as error:
+            assert isinstance(
+                error.__cause__, requests.exceptions.ReadTimeout
+            ), (
+                f'Убедитесь, что в функции `{func_name}` превышение времени '
+                'ожидания ответа обрабатывается как `Timeout`'
+            )
+        else:
+            assert False, (
+                f'Убедитесь, что в функции `{func_name}` обрабатываете ситуацию, '
+                'когда API не отвечает за отведенное время'
+            )
+        finally:
+            listener.close()
+            for connection in connections:
+                connection.close()
+        assert len(connections) == 1, (
+            'Убедитесь, что запрос не повторяется после превышения '
+            'времени ожидания ответа'
+        )
+
+    def test_send_message_retry_after(self, monkeypatch):
+        import homework
+
+        class MockFloodedBot:
+            calls = 0
+
+            def send_message(self, chat_id=None, text=None, **kwargs):
+                self.calls += 1
+                if self.calls == 1:
+                    raise telegram.error.RetryAfter(3)
+
+        sleeps = []
+        monkeypatch.setattr(homework.time, 'sleep', sleeps.append)
+        monkeypatch.setattr(homework, 'TELEGRAM_CHAT_ID', 12345)
+        monkeypatch.setattr(homework, '_last_send_times', {})
+
+        bot = MockFloodedBot()
+        homework.send_message(bot, 'test')
+        assert bot.calls == 2, (
+            'Убедитесь, что при ошибке `RetryAfter` сообщение '
+            'отправляется повторно'
+        )
+        assert 3 in sleeps, (
+            'Убедитесь, что перед повторной отправкой выдерживается '
+            'пауза `retry_after`'
+        )
+
+    def test_send_message_retry_after_twice(self, monkeypatch):
+        import homework
+
+        class MockFloodedBot:
+            calls = 0
+
+            def send_message(self, chat_id=None, text=None, **kwargs):
+                self.calls += 1
+                raise telegram.error.RetryAfter(3)
+
+        monkeypatch.setattr(homework.time, 'sleep', lambda _: None)
+        monkeypatch.setattr(homework, 'TELEGRAM_CHAT_ID', 12345)
+        monkeypatch.setattr(homework, '_last_send_times', {})
+
+        bot = MockFloodedBot()
+        try:
+            homework.send_message(bot, 'test')
+        except homework.BotSendMessageError:
+            pass
+        else:
+            assert False, (
+                'Убедитесь, что ошибка telegram при повторной отправке '
+                'приводит к `BotSendMessageError`'
+            )
+        assert bot.calls == 2, (
+            'Убедитесь, что после `RetryAfter` сообщение отправляется '
+            'повторно только один раз'
+        )
+
+    def test_main_survives_flood_control(self, monkeypatch):
+        import homework
+
+        class StopLoop(Exception):
+            pass
+
+        class MockFloodedBot:
+            calls = 0
+
+            def __init__(self, token=None, **kwargs):
+                pass
+
+            def send_message(self, chat_id=None, text=None, **kwargs):
+                MockFloodedBot.calls += 1
+                raise telegram.error.RetryAfter(3)
+
+        def mock_get_api_answer(current_timestamp):
+            raise ConnectionError('Недоступен endpoint')
+
+        def mock_sleep(seconds):
+            if seconds != 3:
+                raise StopLoop
+
+        monkeypatch.setattr(homework, 'PRACTICUM_TOKEN', 'sometoken')
+        monkeypatch.setattr(homework, 'TELEGRAM_TOKEN', '1234:abcdefg')
+        monkeypatch.setattr(homework, 'TELEGRAM_CHAT_ID', 12345)
+        monkeypatch.setattr(homework, '_last_send_times', {})
+        monkeypatch.setattr(homework, 'Bot', MockFloodedBot)
+        monkeypatch.setattr(homework, 'get_api_answer', mock_get_api_answer)
+        monkeypatch.setattr(homework.time, 'sleep', mock_sleep)
+
+        try:
+            homework.main()
+        except StopLoop:
+            pass
+        assert MockFloodedBot.calls == 2, (
+            'Убедитесь, что сбой отправки сообщения об ошибке не '
+            'останавливает бота и не отправляется в telegram повторно'
+        )
+
+    def test_send_message_interval(self, monkeypatch):
+        import homework
+
+        sleeps = []
+        monkeypatch.setattr(homework.time, 'sleep', sleeps.append)
+        monkeypatch.setattr(homework.time, 'monotonic', lambda: 100.25)
+        monkeypatch.setattr(homework, 'TELEGRAM_CHAT_ID', 12345)
+        monkeypatch.setattr(homework, '_last_send_times', {12345: 100.0})
+        monkeypatch.setattr(homework, 'SEND_MESSAGE_INTERVAL', 1.0)
+
+        homework.send_message(MockTelegramBot(token='1234:abcdefg'), 'test')
+        assert sleeps == [0.75], (
+            'Убедитесь, что между отправками сообщений выдерживается '
+            'пауза `SEND_MESSAGE_INTERVAL`'
+        )
+
+    def test_get_500_api_answer_after_retries(self, monkeypatch,
+                                              adapter_session):
+        import homework
+
+        requests_count = []
+
+        class ServerErrorHandler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                requests_count.append(self.path)
+                self.send_response(HTTPStatus.INTERNAL_SERVER_ERROR)
+                self.end_headers()
+
+            def log_message(self, *args):
+                pass
+
+        server = HTTPServer(('127.0.0.1', 0), ServerErrorHandler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        monkeypatch.setattr(homework, 'SESSION', adapter_session)
+        monkeypatch.setattr(
+            homework, 'ENDPOINT', f'http://127.0.0.1:{server.server_port}/'
+        )
+        monkeypatch.setattr('urllib3.util.retry.time.sleep', lambda _: None)
+
+        try:
+            homework.get_api_answer(1)
+        except homework.WrongConnectionError:
+            pass
+        else:
+            assert False, (
+                'Убедитесь, что после исчерпания повторов ответ 5xx '
+                'обрабатывается как неверный статус ответа API'
+            )
+        finally:
+            server.shutdown()
+            server.server_close()
+        assert len(requests_count) == 4, (
+            'Убедитесь, что запрос при ответе 5xx повторяется 3 раза'
+        )
+
+    def test_remember_status(self, monkeypatch):
+        import homework
+
+        func_name = 'remember_status'
+        utils.check_function(homework, func_name, 2)
+
+        last_statuses = OrderedDict()
+        transitions = [
+            ('reviewing', True), ('reviewing', False), ('rejected', True),
+            ('reviewing', True), ('approved', True),
+        ]
+        for status, changed in transitions:
+            result = homework.remember_status(
+                last_statuses, {'id': 1, 'status': status}
+            )
+            assert result is changed, (
+                f'Убедитесь, что функция `{func_name}` сообщает об изменении '
+                'статуса только при отличии от последнего отправленного'
+            )
+
+        monkeypatch.setattr(homework, 'MAX_TRACKED_HOMEWORKS', 2)
+        for homework_id in (2, 3):
+            homework.remember_status(
+                last_statuses, {'id': homework_id, 'status': 'reviewing'}
+            )
+        assert list(last_statuses) == [2, 3], (
+            f'Убедитесь, что функция `{func_name}` хранит ограниченное '
+            'число последних работ'
+        )
+
+    def test_is_valid_timestamp(self):
+        import homework
+
+        func_name = 'is_valid_timestamp'
+        utils.check_function(homework, func_name, 1)
+
+        for value in (0, 1000198000, 1000198000.5):
+            assert homework.is_valid_timestamp(value), (
+                f'Убедитесь, что функция `{func_name}` принимает '
+                f'метку времени {value!r}'
+            )
+        for value in (None, '1000198000', True, -1, [1],
+                      float('inf'), float('nan')):
+            assert not homework.is_valid_timestamp(value), (
+                f'Убедитесь, что функция `{func_name}` отклоняет '
+                f'значение {value!r}'
+            )
+
+    def test_get_api_answer_zero_timestamp(self, monkeypatch,
+                                           random_timestamp):
+        import homework
+
+        def mock_response_get(*args, **kwargs):
+            return MockResponseGET(
+                *args, random_timestamp=random_timestamp,
+                current_timestamp=0, **kwargs
+            )
+
+        monkeypatch.setattr(homework.SESSION, 'get', mock_response_get)
+
+        result = homework.get_api_answer(0)
+        assert result['current_date'] == random_timestamp, (
+            'Проверьте, что `get_api_answer` передает `from_date=0` '
+            'без подмены текущим временем'
+        )
+
+    def test_next_interval(self, monkeypatch):
+        import homework
+
+        func_name = 'next_interval'
+        utils.check_function(homework, func_name, 2)
+
+        monkeypatch.setattr(homework, 'RETRY_TIME', 10)
+        monkeypatch.setattr(homework, 'MAX_RETRY_TIME', 60)
+
+        interval = 10
+        intervals = []
+        for _ in range(4):
+            interval = homework.next_interval(interval, False)
+            intervals.append(interval)
+        assert intervals == [20, 40, 60, 60], (
+            f'Убедитесь, что функция `{func_name}` удваивает паузу '
+            'без новых статусов, не превышая `MAX_RETRY_TIME`'
+        )
+        assert homework.next_interval(interval, True) == 10, (
+            f'Убедитесь, что функция `{func_name}` сбрасывает паузу '
+            'до `RETRY_TIME` при новых статусах'
+        )
+
+        for max_retry_time in (0, -5):
+            monkeypatch.setattr(homework, 'MAX_RETRY_TIME', max_retry_time)
+            assert homework.next_interval(10, False) == 10, (
+                f'Убедитесь, что функция `{func_name}` не опускает паузу '
+                'ниже `RETRY_TIME`'
+            )
+
+    def test_main_invalid_max_retry_time(self, monkeypatch):
+        import homework
+
+        monkeypatch.setattr(homework, 'PRACTICUM_TOKEN', 'sometoken')
+        monkeypatch.setattr(homework, 'TELEGRAM_TOKEN', '1234:abcdefg')
+        monkeypatch.setattr(homework, 'TELEGRAM_CHAT_ID', 12345)
+        monkeypatch.setattr(homework, 'MAX_RETRY_TIME', None)
+
+        try:
+            homework.main()
+        except SystemExit:
+            pass
+        else:
+            assert False, (
+                'Убедитесь, что при некорректном `MAX_RETRY_TIME` '
+                'происходит выход из программы `SystemExit`'
+            )